@@ -3,10 +3,11 @@ from flask_cors import CORS
 import os
 from werkzeug.utils import secure_filename
 from datetime import datetime
-from defaulter_predict import predict_defaulters, save_results_to_excel
+from defaulter_predict import predict_defaulters, save_results_to_excel, student_records, load_results_frame
 from email_service import send_email
 from graph_generator import generate_attendance_graphs
 import traceback
+import numpy as np
 import pandas as pd
 
 app = Flask(__name__)
@@ -109,7 +110,7 @@ def upload_file():
                 "threshold": results["threshold"],
                 "results_file": results_filename if saved_path else None
             },
-            "data": results["data"]  # Include all student data with classification
+            "data": student_records(results["frame"])  # Include all student data with classification
         }
         
         return jsonify(response_data), 200
@@ -162,7 +163,7 @@ def send_email_report():
         }
 
         # Generate graphs
-        df = pd.read_excel(file_path) if file_path.endswith(('.xlsx', '.xls')) else pd.read_csv(file_path)
+        df = load_results_frame(file_path)
         
         class_info = {
             'teacher_name': data['teacher_name'],
@@ -205,12 +206,12 @@ def send_student_email():
             return jsonify({"error": "Results file not found"}), 404
 
         # Read the results file
-        df = pd.read_excel(file_path) if file_path.endswith(('.xlsx', '.xls')) else pd.read_csv(file_path)
+        df = load_results_frame(file_path)
         
-        # Filter defaulter students
-        defaulters = df[df['Classification'] == 'Defaulter']
+        # Select defaulter students by position
+        defaulter_index = np.flatnonzero(df['Classification'] == 'Defaulter')
         
-        if defaulters.empty:
+        if len(defaulter_index) == 0:
             return jsonify({"message": "No defaulter students found"}), 200
 
         # Send emails to all defaulter students
@@ -218,10 +219,12 @@ def send_student_email():
         failed_count = 0
         failed_emails = []
 
-        for _, student in defaulters.iterrows():
-            if 'Email' in student and pd.notna(student['Email']):
+        emails = df['Email'].to_numpy()[defaulter_index] if 'Email' in df.columns else []
+
+        for email in emails:
+            if pd.notna(email):
                 success, message = send_email(
-                    recipient_email=student['Email'],
+                    recipient_email=email,
                     teacher_name=None,
                     results_file_path=None,
                     results_data=None,
@@ -232,7 +235,7 @@ def send_student_email():
                     success_count += 1
                 else:
                     failed_count += 1
-                    failed_emails.append(f"{student['Email']}: {message}")
+                    failed_emails.append(f"{email}: {message}")
 
         return jsonify({
             "message": f"Sent {success_count} emails successfully, {failed_count} failed",
@@ -257,7 +260,7 @@ def generate_graphs():
         if not os.path.exists(file_path):
             return jsonify({"error": "Results file not found"}), 404
             
-        df = pd.read_excel(file_path) if file_path.endswith(('.xlsx', '.xls')) else pd.read_csv(file_path)
+        df = load_results_frame(file_path)
         
         class_info = {
             'teacher_name': data['teacher_name'],
@@ -0,0 +1,161 @@
+import sys
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+from defaulter_predict import categorize_students_attendance, student_records, export_frame
+
+
+def make_students(n, seed=0, rounded=True, blank_fraction=0.0):
+    """
+    Generate a synthetic class roster with n students.
+    
+    With rounded=False attendance is computed from lectures attended out of 60
+    (e.g. 66.666...), which keeps it in the float64 layout; blank_fraction of
+    the rows get no attendance value.
+    """
+    rng = np.random.default_rng(seed)
+    if rounded:
+        attendance = rng.uniform(40, 100, size=n).round(2)
+    else:
+        attendance = rng.integers(24, 61, size=n) / 60 * 100
+    attendance[rng.random(n) < blank_fraction] = np.nan
+    return pd.DataFrame({
+        'Roll Number': np.arange(1, n + 1),
+        'Name': [f"Student {i}" for i in range(n)],
+        'Gender': rng.choice(['Male', 'Female'], size=n),
+        'Division': rng.choice(['A', 'B', 'C'], size=n),
+        'Email': [f"student{i}@college.edu" for i in range(n)],
+        'Attendance Percentage': attendance,
+    })
+
+
+def memory_per_student(df):
+    """
+    Return the in-memory size of the DataFrame in bytes per student row.
+    
+    memory_usage(deep=True) sizes every object cell separately, so strings
+    shared through interning would be counted once per row. Object columns are
+    measured here as their pointer array plus each distinct object once.
+    """
+    if len(df) == 0:
+        return 0.0
+    total = 0
+    for col in df.columns:
+        values = df[col]
+        if values.dtype == object:
+            total += values.memory_usage(index=False)
+            unique_objects = {id(v): v for v in values}
+            total += sum(sys.getsizeof(v) for v in unique_objects.values())
+        else:
+            total += values.memory_usage(index=False, deep=True)
+    return total / len(df)
+
+
+def baseline_pipeline(df, threshold):
+    """Previous upload path: object DataFrame, three lists of dicts, Excel frame."""
+    df = df.copy()
+    defaulters = df[df['Attendance Percentage'] < threshold].copy()
+    non_defaulters = df[df['Attendance Percentage'] >= threshold].copy()
+    df['Classification'] = df['Attendance Percentage'].apply(
+        lambda x: 'Defaulter' if x < threshold else 'Non-Defaulter'
+    )
+    data = df.to_dict(orient='records')
+    results = {
+        "defaulter_count": len(defaulters),
+        "non_defaulter_count": len(non_defaulters),
+        "data": data,
+        "defaulter_data": defaulters.to_dict(orient='records'),
+        "non_defaulter_data": non_defaulters.to_dict(orient='records'),
+    }
+    # save_results_to_excel built this frame before writing it
+    excel_frame = pd.DataFrame(results["data"])
+    return results, excel_frame
+
+
+def compact_pipeline(df, threshold):
+    """Current upload path: typed DataFrame, index arrays, JSON records, Excel frame."""
+    frame, defaulter_index, non_defaulter_index, defaulter_count, non_defaulter_count = \
+        categorize_students_attendance(df.copy(), threshold)
+    results = {
+        "defaulter_count": defaulter_count,
+        "non_defaulter_count": non_defaulter_count,
+        "frame": frame,
+        "defaulter_index": defaulter_index,
+        "non_defaulter_index": non_defaulter_index,
+    }
+    # app.py returns these records from /upload and save_results_to_excel
+    # writes export_frame, so both are part of the request path
+    data = student_records(frame)
+    excel_frame = export_frame(frame)
+    return results, data, excel_frame
+
+
+def check_equivalence(baseline, compact):
+    """
+    Assert both pipelines classify every student identically.
+    
+    Rows with blank attendance are compared separately: the baseline labelled
+    them 'Non-Defaulter' (NaN < threshold is False) while they are now left
+    without a Classification. Counts match because the baseline counted only
+    rows with attendance >= threshold.
+    
+    Returns:
+        int: Number of blank-attendance rows
+    """
+    base_results, base_excel = baseline
+    results, data, excel_frame = compact
+    assert results["defaulter_count"] == base_results["defaulter_count"]
+    assert results["non_defaulter_count"] == base_results["non_defaulter_count"]
+
+    blank = excel_frame['Attendance Percentage'].isna().to_numpy()
+    assert (base_excel['Classification'][blank] == 'Non-Defaulter').all()
+    assert excel_frame['Classification'][blank].isna().all()
+
+    for is_blank, base_row, row in zip(blank, base_results["data"], data):
+        if is_blank:
+            for key in ('Attendance Percentage', 'Classification'):
+                del base_row[key], row[key]
+        assert row == base_row
+
+    pd.testing.assert_frame_equal(excel_frame[~blank], base_excel[~blank], check_dtype=False)
+    return int(blank.sum())
+
+
+def measure(fn, df, threshold):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(df, threshold)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def run(label, df, threshold):
+    n = len(df)
+    baseline, base_time, base_peak = measure(baseline_pipeline, df, threshold)
+    compact, compact_time, compact_peak = measure(compact_pipeline, df, threshold)
+    blank_count = check_equivalence(baseline, compact)
+    results_df = compact[0]["frame"]
+    layout = results_df['Attendance Percentage'].dtype
+
+    print(f"{label}: {n} students, attendance stored as {layout}")
+    print(f"  Classification and counts match baseline; {blank_count} blank-attendance rows "
+          f"now unclassified (baseline: Non-Defaulter)")
+    print(f"  Baseline: {base_time:.3f}s, peak {base_peak / n:.1f} bytes/student")
+    print(f"  Compact:  {compact_time:.3f}s, peak {compact_peak / n:.1f} bytes/student")
+    print(f"  Compact frame: {memory_per_student(results_df):.1f} bytes/student")
+    print(f"  Dtypes: {dict(results_df.dtypes.astype(str))}")
+
+
+def main(n=100000, threshold=75):
+    # float32 narrowing depends on the data: it applies only when attendance
+    # is recorded to two decimals, so both layouts are reported
+    run("Rounded attendance", make_students(n), threshold)
+    run("Computed attendance with blanks",
+        make_students(n, seed=1, rounded=False, blank_fraction=0.02), threshold)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -1,7 +1,128 @@
 import pandas as pd
+import numpy as np
+import sys
 import os
 
 
+CLASSIFICATION_LABELS = ['Defaulter', 'Non-Defaulter']
+CATEGORICAL_COLUMNS = ['Gender', 'Classification']
+# Attendance is stored as float32 only when it is recorded to this many decimals
+ATTENDANCE_DECIMALS = 2
+
+
+def compact_student_frame(df):
+    """
+    Convert a student DataFrame to a compact, typed representation in place.
+    
+    Gender and Classification become categoricals, attendance is stored as
+    float32 when it is recorded to ATTENDANCE_DECIMALS decimals (computed
+    percentages such as 66.666... stay float64) and low-cardinality
+    string columns share interned string objects.
+    
+    Args:
+        df: DataFrame containing student data
+        
+    Returns:
+        DataFrame: The same DataFrame with compact column types
+    """
+    for col in df.columns:
+        if col in CATEGORICAL_COLUMNS:
+            if col == 'Classification':
+                df[col] = pd.Categorical(df[col], categories=CLASSIFICATION_LABELS)
+            else:
+                df[col] = df[col].astype('category')
+        elif col == 'Attendance Percentage':
+            df[col] = narrow_attendance(pd.to_numeric(df[col]).to_numpy(dtype=np.float64))
+        elif df[col].dtype == object and df[col].nunique() <= len(df) // 2:
+            # Interning only pays off when values repeat; unique columns such
+            # as names and emails are left alone
+            df[col] = df[col].map(lambda v: sys.intern(v) if isinstance(v, str) else v)
+    
+    return df
+
+
+def narrow_attendance(values):
+    """
+    Narrow float64 attendance values to float32 if every value round-trips.
+    
+    Values recorded to ATTENDANCE_DECIMALS decimals (e.g. 63.02, 75.1) are
+    recovered exactly by widen_attendance; otherwise the values are kept as
+    float64 so that no student's attendance changes.
+    """
+    narrowed = values.astype(np.float32)
+    if np.array_equal(widen_attendance(narrowed), values, equal_nan=True):
+        return narrowed
+    return values
+
+
+def widen_attendance(values):
+    """Recover the original float64 attendance values from float32 storage."""
+    if values.dtype != np.float32:
+        return np.asarray(values, dtype=np.float64)
+    return np.round(values.astype(np.float64), ATTENDANCE_DECIMALS)
+
+
+def split_by_attendance(df, threshold=75):
+    """
+    Split students into defaulters and non-defaulters without copying rows.
+    
+    Args:
+        df: DataFrame containing an 'Attendance Percentage' column
+        threshold: Attendance percentage threshold (default: 75)
+        
+    Returns:
+        tuple: (defaulter_index, non_defaulter_index) positional index arrays;
+        rows with missing attendance appear in neither
+    """
+    # Compare float64 values, never the narrowed float32 ones
+    attendance = widen_attendance(df['Attendance Percentage'].to_numpy())
+    return np.flatnonzero(attendance < threshold), np.flatnonzero(attendance >= threshold)
+
+
+def find_invalid_attendance_rows(df):
+    """Return the spreadsheet row numbers whose attendance value is not numeric."""
+    values = df['Attendance Percentage']
+    invalid = pd.to_numeric(values, errors='coerce').isna() & values.notna()
+    # +2 accounts for the header row and 1-based row numbering
+    return [int(i) + 2 for i in np.flatnonzero(invalid.to_numpy())]
+
+
+def student_records(df, index=None):
+    """
+    Convert (a positional subset of) the student DataFrame to a list of dicts.
+    
+    Args:
+        df: Compact student DataFrame
+        index: Optional positional index array selecting the rows to export
+        
+    Returns:
+        list: One dict per student, suitable for JSON serialization
+    """
+    return export_frame(df if index is None else df.iloc[index]).to_dict(orient='records')
+
+
+def export_frame(df):
+    """
+    Return a copy of the student DataFrame with plain types for export.
+    
+    Attendance is widened back to its original float64 values so that float32
+    storage does not leak artefacts such as 72.30000305 into JSON or Excel output.
+    """
+    out = df.copy()
+    if 'Attendance Percentage' in out.columns:
+        out['Attendance Percentage'] = widen_attendance(out['Attendance Percentage'].to_numpy())
+    for col in out.columns:
+        if isinstance(out[col].dtype, pd.CategoricalDtype):
+            out[col] = out[col].astype(object)
+    return out
+
+
+def load_results_frame(file_path):
+    """Read a saved results file into a compact student DataFrame."""
+    df = pd.read_excel(file_path) if file_path.endswith(('.xlsx', '.xls')) else pd.read_csv(file_path)
+    return compact_student_frame(df)
+
+
 def categorize_students_attendance(df, threshold=75):
     """
     Categorize students into defaulters and non-defaulters based on attendance percentage.
@@ -11,30 +132,34 @@ def categorize_students_attendance(df, threshold=75):
         threshold: Attendance percentage threshold (default: 75)
         
     Returns:
-        tuple: (defaulter_students, non_defaulter_students, defaulter_count, non_defaulter_count)
+        tuple: (df, defaulter_index, non_defaulter_index, defaulter_count, non_defaulter_count)
     """
     try:
         # Validate required columns
         if 'Attendance Percentage' not in df.columns:
-            return None, None, None, None
+            return None, None, None, None, None
         
-        # Categorize students
-        defaulter_students = df[df['Attendance Percentage'] < threshold].copy()
-        non_defaulter_students = df[df['Attendance Percentage'] >= threshold].copy()
+        # Categorize students as positional views into df, using the float64
+        # values before compact_student_frame narrows them
+        df['Attendance Percentage'] = pd.to_numeric(df['Attendance Percentage']).astype(np.float64)
+        defaulter_index, non_defaulter_index = split_by_attendance(df, threshold)
+        
+        compact_student_frame(df)
         
-        defaulter_count = len(defaulter_students)
-        non_defaulter_count = len(non_defaulter_students)
+        defaulter_count = len(defaulter_index)
+        non_defaulter_count = len(non_defaulter_index)
         
-        # Add classification column
-        df['Classification'] = df['Attendance Percentage'].apply(
-            lambda x: 'Defaulter' if x < threshold else 'Non-Defaulter'
-        )
+        # Add classification column (left empty for missing attendance)
+        codes = np.full(len(df), -1, dtype=np.int8)
+        codes[defaulter_index] = 0
+        codes[non_defaulter_index] = 1
+        df['Classification'] = pd.Categorical.from_codes(codes, categories=CLASSIFICATION_LABELS)
         
-        return df, defaulter_students, non_defaulter_students, defaulter_count, non_defaulter_count
+        return df, defaulter_index, non_defaulter_index, defaulter_count, non_defaulter_count
         
     except Exception as e:
         print(f"Error in categorize_students_attendance: {e}")
-        return None, None, None, None
+        return None, None, None, None, None
 
 
 def predict_defaulters(file_path, threshold=75, teacher_name="", teacher_email=""):
@@ -73,8 +198,14 @@ def predict_defaulters(file_path, threshold=75, teacher_name="", teacher_email="
                 "error": f"Missing required columns: {', '.join(missing_columns)}"
             }
         
+        invalid_rows = find_invalid_attendance_rows(df)
+        if invalid_rows:
+            return {
+                "error": f"Invalid attendance values in rows: {', '.join(map(str, invalid_rows))}"
+            }
+        
         # Categorize students
-        results_df, defaulter_students, non_defaulter_students, defaulter_count, non_defaulter_count = \
+        results_df, defaulter_index, non_defaulter_index, defaulter_count, non_defaulter_count = \
             categorize_students_attendance(df, threshold)
         
         if results_df is None:
@@ -89,9 +220,9 @@ def predict_defaulters(file_path, threshold=75, teacher_name="", teacher_email="
             "threshold": threshold,
             "teacher_name": teacher_name,
             "teacher_email": teacher_email,
-            "data": results_df.to_dict(orient='records'),
-            "defaulter_data": defaulter_students.to_dict(orient='records'),
-            "non_defaulter_data": non_defaulter_students.to_dict(orient='records')
+            "frame": results_df,
+            "defaulter_index": defaulter_index,
+            "non_defaulter_index": non_defaulter_index
         }
         
         return results
@@ -115,8 +246,7 @@ def save_results_to_excel(results, output_path):
         if results.get("error"):
             return None
         
-        df = pd.DataFrame(results["data"])
-        df.to_excel(output_path, index=False)
+        export_frame(results["frame"]).to_excel(output_path, index=False)
         
         return output_path
         
@@ -2,6 +2,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_pdf import PdfPages
 import os
+from defaulter_predict import split_by_attendance
 
 def generate_attendance_graphs(df, class_info, output_folder):
     """Generate attendance analysis graphs and save as PDF"""
@@ -16,6 +17,7 @@ def generate_attendance_graphs(df, class_info, output_folder):
 
     # Gender Distribution
     gender_counts = df['Gender'].value_counts()
+    gender_counts = gender_counts[gender_counts > 0]
     axs[0].pie(gender_counts, labels=gender_counts.index, autopct='%1.1f%%', startangle=140)
     axs[0].set_title('Distribution of Gender')
     total_students = gender_counts.sum()
@@ -30,8 +32,10 @@ def generate_attendance_graphs(df, class_info, output_folder):
 
     # Defaulter Distribution
     threshold = class_info.get('threshold', 75)
-    defaulter_count = (df['Attendance Percentage'] < threshold).sum()
-    non_defaulter_count = (df['Attendance Percentage'] >= threshold).sum()
+    defaulter_index, non_defaulter_index = split_by_attendance(df, threshold)
+    defaulter_students = df.iloc[defaulter_index]
+    defaulter_count = len(defaulter_index)
+    non_defaulter_count = len(non_defaulter_index)
     labels = ['Defaulter', 'Non-Defaulter']
     axs[1].pie([defaulter_count, non_defaulter_count], labels=labels, 
                autopct='%1.1f%%', startangle=140)
@@ -58,9 +62,8 @@ def generate_attendance_graphs(df, class_info, output_folder):
                 verticalalignment='center', transform=axs[2].transAxes, wrap=True)
 
     # Scatter Plot
-    defaulter_student = df[df['Attendance Percentage'] < threshold]
-    girls = defaulter_student[defaulter_student['Gender'] == 'Female']
-    boys = defaulter_student[defaulter_student['Gender'] == 'Male']
+    girls = defaulter_students[defaulter_students['Gender'] == 'Female']
+    boys = defaulter_students[defaulter_students['Gender'] == 'Male']
     
     axs[3].scatter(range(len(girls)), girls['Attendance Percentage'], 
                   color='red', label='Defaulter (Girls)', alpha=0.5)
@@ -84,7 +87,6 @@ def generate_attendance_graphs(df, class_info, output_folder):
                 verticalalignment='center', transform=axs[3].transAxes, wrap=True)
 
     # Defaulter Table
-    defaulter_students = df[df['Attendance Percentage'] < threshold]
     table_data = defaulter_students[['Roll Number', 'Name', 'Attendance Percentage']]
     
     axs[4].axis('off')